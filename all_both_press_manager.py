@@ -9,6 +9,7 @@ from config import (
     ALL_BOTH_PRESS_COOLDOWN
 )
 from logger import get_logger, lazy_format
+from touch_slider import get_slider_state
 
 # Get logger instance
 logger = get_logger()
@@ -19,10 +20,17 @@ class AllBothPressManager:
     are in the both-press state for a configurable duration.
     """
     
-    def __init__(self, midi_interface):
+    def __init__(self, midi_interface, touch_sliders):
         self.midi = midi_interface
         self.enabled = ALL_BOTH_PRESS_TOGGLE_ENABLED
         self.cc_number = ALL_BOTH_PRESS_CC_NUMBER
+        self._on_msg = ControlChange(self.cc_number, 127)
+        self._off_msg = ControlChange(self.cc_number, 0)
+        self.slider_state = get_slider_state()
+        
+        # The slider set is fixed after startup, so decide once whether to track it
+        self._slider_count = len(touch_sliders)
+        self._active = self.enabled and self._slider_count > 0
         
         # Timing configuration
         self.stable_time = ALL_BOTH_PRESS_STABLE_TIME
@@ -37,6 +45,10 @@ class AllBothPressManager:
         self.toggle_start_time = None
         self.last_trigger_time = -self.cooldown  # Allow immediate triggering
         
+        # Status dict is rebuilt only after a state change
+        self._status_dirty = True
+        self._cached_status = None
+        
         if self.enabled:
             logger.info(lazy_format("All Both-Press Toggle enabled (CC {})", self.cc_number))
             logger.info(lazy_format("  Stable time: {}s, Min duration: {}s, Max duration: {}s, Cooldown: {}s",
@@ -55,19 +67,20 @@ class AllBothPressManager:
         Returns:
             bool: True if the toggle state changed, False otherwise
         """
-        if not self.enabled or not touch_sliders:
+        if not self._active:
             return False
         
-        # Count enabled sliders and check their both-press states
-        enabled_sliders = [s for s in touch_sliders if s.enabled]
-        if not enabled_sliders:
+        # Compare the packed both-press flags against the cached enabled pattern
+        state = self.slider_state
+        if not state.enabled_count:
             return False
         
-        all_both_pressed_now = all(slider.both_pressed for slider in enabled_sliders)
+        all_both_pressed_now = state.both_pressed == state.enabled_pattern
         
         # State change detection
         if all_both_pressed_now != self.all_both_pressed:
             self.all_both_pressed = all_both_pressed_now
+            self._status_dirty = True
             
             if self.all_both_pressed:
                 # All sliders just entered both-press state
@@ -89,10 +102,11 @@ class AllBothPressManager:
             self.toggle_active = True
             self.toggle_start_time = current_time
             self.last_trigger_time = current_time
+            self._status_dirty = True
             
             # Send MIDI CC ON
             try:
-                self.midi.send(ControlChange(self.cc_number, 127))
+                self.midi.send(self._on_msg)
                 logger.info(lazy_format("All Both-Press Toggle ACTIVATED (CC {})", self.cc_number))
             except Exception as e:
                 logger.error(lazy_format("Failed to send All Both-Press Toggle MIDI: {}", e))
@@ -109,10 +123,11 @@ class AllBothPressManager:
                 
                 self.toggle_active = False
                 self.toggle_start_time = None
+                self._status_dirty = True
                 
                 # Send MIDI CC OFF
                 try:
-                    self.midi.send(ControlChange(self.cc_number, 0))
+                    self.midi.send(self._off_msg)
                     logger.info(lazy_format("All Both-Press Toggle DEACTIVATED (CC {}) after {}s", 
                                            self.cc_number, toggle_duration))
                 except Exception as e:
@@ -124,7 +139,10 @@ class AllBothPressManager:
     
     def get_status(self):
         """Get current status information about the all both-press toggle."""
-        return {
+        if not self._status_dirty:
+            return self._cached_status
+        
+        self._cached_status = {
             "enabled": self.enabled,
             "cc_number": self.cc_number,
             "all_both_pressed": self.all_both_pressed,
@@ -136,4 +154,6 @@ class AllBothPressManager:
             "min_duration": self.min_duration,
             "max_duration": self.max_duration,
             "cooldown": self.cooldown
-        } 
\ No newline at end of file
+        }
+        self._status_dirty = False
+        return self._cached_status
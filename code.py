@@ -4,6 +4,8 @@ import board
 # Import our modular components
 from config import (
     LOOP_DELAY, 
+    IDLE_LOOP_DELAY,
+    IDLE_TICKS_THRESHOLD,
     CALIBRATION_CHECK_INTERVAL, 
     LOG_LEVEL, 
     LOG_TIMESTAMPS
@@ -16,17 +18,22 @@ from mpr121_manager import (
     periodic_calibration_check,
     perform_led_startup_calibration,
     get_led_calibration_manager,
-    get_mpr121_status
+    get_mpr121_status,
+    refresh_debug_flag
 )
 from midi_manager import MIDIManager
 from display_manager import DisplayManager
-from touch_slider import create_touch_sliders, update_touch_cache_for_all_boards, update_all_sliders, get_slider_status, activity_check_all_sliders
+from touch_slider import create_touch_sliders, update_touch_cache_for_all_boards, update_all_sliders, get_slider_status, activity_check_all_sliders, collect_display_state
 from all_both_press_manager import AllBothPressManager
 
 # -----------------------------------------------------------------------------
 # Main Application
 # -----------------------------------------------------------------------------
 
+def _noop(*args, **kwargs):
+    """Stand-in for main loop steps whose hardware is unavailable."""
+    return False
+
 def print_system_status(mpr121_boards, display_manager, touch_sliders, all_both_press_manager=None):
     """Print comprehensive system status information."""
     logger = get_logger()
@@ -78,6 +85,9 @@ def print_system_status(mpr121_boards, display_manager, touch_sliders, all_both_
 
 def main():
     """Main application function."""
+    # Bind the clock once; it is read every tick of the main loop
+    monotonic = time.monotonic
+    
     # Configure logging based on config
     log_level_map = {
         "ERROR": LogLevel.ERROR,
@@ -86,6 +96,7 @@ def main():
         "DEBUG": LogLevel.DEBUG
     }
     set_log_level(log_level_map.get(LOG_LEVEL, LogLevel.INFO))
+    refresh_debug_flag()
     
     logger = get_logger()
     logger.info("=== Commune Art Installation - Utensils ===")
@@ -127,7 +138,7 @@ def main():
     # Create touch sliders
     logger.info("Creating touch sliders...")
     if midi_available and mpr121_boards and midi_manager:
-        touch_sliders = create_touch_sliders(mpr121_boards, midi_manager.get_interface())
+        touch_sliders = create_touch_sliders(mpr121_boards)
     else:
         logger.warn("Cannot create touch sliders - missing MIDI or MPR121")
         touch_sliders = []
@@ -135,7 +146,7 @@ def main():
     # Initialize all both-press toggle manager
     logger.info("Initializing all both-press toggle manager...")
     if midi_available and midi_manager:
-        all_both_press_manager = AllBothPressManager(midi_manager.get_interface())
+        all_both_press_manager = AllBothPressManager(midi_manager.get_interface(), touch_sliders)
     else:
         logger.warn("Cannot create all both-press manager - missing MIDI")
         all_both_press_manager = None
@@ -144,10 +155,13 @@ def main():
     display_manager.setup_display(touch_sliders)
     
     # Initial display update
-    display_manager.update_display(touch_sliders)
+    display_changes = []
+    collect_display_state(touch_sliders, display_changes)
+    display_manager.update_display(display_changes)
+    display_changes.clear()
     
     # Calibration monitoring variables
-    last_calibration_check = time.monotonic()
+    last_calibration_check = monotonic()
     
     # Get LED calibration manager
     led_calibration_manager = get_led_calibration_manager()
@@ -170,17 +184,35 @@ def main():
     
     logger.info("Press Ctrl+C to exit.")
     
+    # Consecutive loop iterations without MIDI, touch or toggle activity
+    idle_ticks = 0
+    
+    # MIDI output queued by the sliders during a tick, sent in one write at its end
+    pending_midi = []
+    
+    # Bind hot-path callables to locals to avoid repeated attribute lookups.
+    # Steps whose hardware is missing never change after startup, so they are
+    # resolved to a no-op here instead of being re-checked every iteration.
+    do_midi = midi_manager.receive_messages if (midi_available and midi_manager) else _noop
+    send_midi = midi_manager.send_many if (midi_available and midi_manager) else _noop
+    do_cache_update = update_touch_cache_for_all_boards if (mpr121_boards and touch_sliders) else _noop
+    do_slider_update = update_all_sliders if touch_sliders else _noop
+    do_activity_check = activity_check_all_sliders if touch_sliders else _noop
+    do_toggle_update = all_both_press_manager.update if (all_both_press_manager and touch_sliders) else _noop
+    should_trigger_led_calibration = led_calibration_manager.should_trigger_led_calibration
+    update_display = display_manager.update_display
+    sleep = time.sleep
+    
     # Main loop
     try:
         while True:
-            current_time = time.monotonic()
+            current_time = monotonic()
             
             # Process incoming MIDI messages
-            if midi_available and midi_manager:
-                midi_manager.receive_messages(touch_sliders, current_time)
+            midi_received = do_midi(touch_sliders, current_time)
             
             # Check if LED calibration should be triggered
-            if led_calibration_manager.should_trigger_led_calibration(current_time):
+            if should_trigger_led_calibration(current_time):
                 led_calibration_manager.mark_led_calibration_triggered()
                 logger.info("Triggering LED startup calibration...")
                 if mpr121_boards:
@@ -188,25 +220,28 @@ def main():
                 else:
                     logger.warn("No MPR121 boards available - skipping LED calibration")
                 led_calibration_manager.mark_led_calibration_completed()
+                # Calibration blocks for a while; re-sample the clock for this tick
+                current_time = monotonic()
             
             # Update touch cache for all MPR121 boards (single I2C read per board)
-            if mpr121_boards and touch_sliders:
-                update_touch_cache_for_all_boards(mpr121_boards, touch_sliders)
+            do_cache_update(mpr121_boards, touch_sliders)
             
             # Update all sliders using cached data
-            if touch_sliders:
-                display_needs_update = update_all_sliders(touch_sliders)
-                activity_check_all_sliders(touch_sliders)
-            else:
-                display_needs_update = False
+            display_needs_update = do_slider_update(touch_sliders, display_changes, pending_midi, current_time)
+            do_activity_check(touch_sliders, pending_midi, current_time)
+            
+            # Send this tick's slider MIDI output in a single write
+            if pending_midi:
+                send_midi(pending_midi)
+                pending_midi.clear()
             
             # Update all both-press toggle manager
-            if all_both_press_manager and touch_sliders:
-                all_both_press_manager.update(touch_sliders, current_time)
+            toggle_changed = do_toggle_update(touch_sliders, current_time)
             
             # Update display if needed
             if display_needs_update:
-                display_manager.update_display(touch_sliders)
+                update_display(display_changes)
+                display_changes.clear()
             
             # Periodic calibration health check
             if current_time - last_calibration_check >= CALIBRATION_CHECK_INTERVAL:
@@ -216,7 +251,13 @@ def main():
                     logger.warn("No MPR121 boards available - skipping periodic calibration check")
                 last_calibration_check = current_time
             
-            time.sleep(LOOP_DELAY)
+            # Back off the loop delay after a stretch of idle iterations
+            if midi_received or display_needs_update or toggle_changed:
+                idle_ticks = 0
+            else:
+                idle_ticks += 1
+            
+            sleep(IDLE_LOOP_DELAY if idle_ticks > IDLE_TICKS_THRESHOLD else LOOP_DELAY)
             
     except KeyboardInterrupt:
         logger.info("Shutting down Commune art installation...")
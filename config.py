@@ -2,6 +2,8 @@
 # Configuration
 # -----------------------------------------------------------------------------
 LOOP_DELAY = 0.01  # 10ms loop delay for faster response
+IDLE_LOOP_DELAY = 0.05  # 50ms loop delay once the system has been idle for a while
+IDLE_TICKS_THRESHOLD = 50  # Consecutive idle loop iterations before using IDLE_LOOP_DELAY
 DEBOUNCE_INTERVAL = 0.1  # 100ms debounce time for faster touch response
 
 # MPR121 Default Thresholds (from Adafruit MPR121 library)
@@ -8,16 +8,26 @@ from logger import get_logger, lazy_format
 # Get logger instance
 logger = get_logger()
 
-# Release any existing displays
-displayio.release_displays()
+# Zero-padded strings for every MIDI value, so redraws never format ints
+_VALUE_STRS = tuple(f"{v:03}" for v in range(128))
 
 class DisplayManager:
+    _released = False  # Existing displays are released once per process
+    
     def __init__(self, i2c):
+        # Release any existing displays
+        if not DisplayManager._released:
+            displayio.release_displays()
+            DisplayManager._released = True
+        
         self.i2c = i2c
         self.display_enabled = False
         self.display = None
         self.splash = None
         self.slider_labels = []
+        self._last_texts = []  # Last text written to each label
+        self._cc_strs = []  # (normal, both-pressed) CC number strings per label
+        self._prefixes = []  # "<index>|" prefix per label
         self.initialization_error = None
         
         self._initialize_display()
@@ -91,12 +101,15 @@ class DisplayManager:
         
         try:
             self.slider_labels = []
+            self._last_texts = []
+            self._cc_strs = []
+            self._prefixes = []
             NUM_COLS = 2
             NUM_ROWS = 4
             COL_WIDTH = 64
             ROW_HEIGHT = 12
             
-            for i, _ in enumerate(touch_sliders):
+            for i, slider in enumerate(touch_sliders):
                 if i >= NUM_COLS * NUM_ROWS:
                     break
                     
@@ -105,14 +118,23 @@ class DisplayManager:
                 x_pos = col * COL_WIDTH
                 y_pos = (row * ROW_HEIGHT) + 12
 
+                text = f"S{i}: {SLIDERS[i]['initial_value']}"
                 text_label = label.Label(
                     font=terminalio.FONT,
-                    text=f"S{i}: {SLIDERS[i]['initial_value']}",
+                    text=text,
                     color=0xFFFF,
                     x=x_pos,
                     y=y_pos
                 )
                 self.slider_labels.append(text_label)
+                self._last_texts.append(text)
+                
+                # CC numbers are static per slider, so format them once
+                config = slider.config
+                cc_str = f"{config['cc_number']:02}"
+                both_cc = config["both_press_cc"]
+                self._cc_strs.append((cc_str, f"{both_cc:02}" if both_cc is not None else cc_str))
+                self._prefixes.append(f"{i}|")
                 self.splash.append(text_label)
             
             logger.info(lazy_format("Display setup complete with {} labels", len(self.slider_labels)))
@@ -121,9 +143,17 @@ class DisplayManager:
             logger.error(lazy_format("Error setting up display labels: {}", e))
             logger.info("System will continue without display labels")
             self.slider_labels = []
+            self._last_texts = []
+            self._cc_strs = []
+            self._prefixes = []
     
-    def update_display(self, touch_sliders):
-        """Update display with current slider states with error handling."""
+    def update_display(self, changes):
+        """Update display labels for changed sliders with error handling.
+        
+        Args:
+            changes: List of (index, both_pressed, value, status) tuples as
+                collected by update_all_sliders / collect_display_state
+        """
         if not self.display_enabled:
             return
         
@@ -131,19 +161,20 @@ class DisplayManager:
             return
             
         try:
-            for i, slider in enumerate(touch_sliders):
-                if i >= len(self.slider_labels):
-                    break
-                    
-                status = 'B' if slider.both_pressed else (
-                    'D' if slider.down_debouncer.value else (
-                    'U' if slider.up_debouncer.value else ''))
+            label_count = len(self.slider_labels)
+            for i, both_pressed, value, status in changes:
+                if i >= label_count:
+                    continue
                 
-                cc_num = (slider.config["both_press_cc"] if slider.both_pressed 
-                         else slider.config["cc_number"])
-                val = "127" if slider.both_pressed else f"{int(slider.value):03}"
+                cc_str = self._cc_strs[i][1] if both_pressed else self._cc_strs[i][0]
+                val = "127" if both_pressed else _VALUE_STRS[value]
                 
-                self.slider_labels[i].text = f"{i}|{cc_num:02}|{val}|{status}"
+                # Concatenating small strings is cheaper than an f-string on CircuitPython.
+                # Only touch labels whose text changed to avoid redraws.
+                text = "".join((self._prefixes[i], cc_str, "|", val, "|", status))
+                if text != self._last_texts[i]:
+                    self.slider_labels[i].text = text
+                    self._last_texts[i] = text
                 
         except Exception as e:
             logger.error(lazy_format("Error updating display: {}", e))
@@ -1,8 +1,7 @@
 import time
-from enum import Enum
 
-class LogLevel(Enum):
-    """Log levels in order of increasing verbosity."""
+class LogLevel:
+    """Log levels in order of increasing verbosity (plain ints for cheap comparisons)."""
     ERROR = 0
     WARN = 1
     INFO = 2
@@ -13,20 +12,34 @@ class Logger:
     
     def __init__(self, level=LogLevel.INFO, enable_timestamps=True):
         self.level = level
+        self._refresh_level_flags()
+        self._monotonic = time.monotonic
+        self.start_time = self._monotonic()
         self.enable_timestamps = enable_timestamps
-        self.start_time = time.monotonic()
     
-    def _format_message(self, level_name, message):
-        """Format log message with optional timestamp."""
-        if self.enable_timestamps:
-            elapsed = time.monotonic() - self.start_time
-            return f"[{elapsed:6.1f}s] {level_name}: {message}"
-        else:
-            return f"{level_name}: {message}"
+    @property
+    def enable_timestamps(self):
+        """Whether log lines are prefixed with the elapsed time."""
+        return self._enable_timestamps
+    
+    @enable_timestamps.setter
+    def enable_timestamps(self, enabled):
+        self._enable_timestamps = enabled
+        # Pick the formatter here instead of branching on every log line
+        self._format_message = self._format_with_timestamp if enabled else self._format_plain
+    
+    def _format_with_timestamp(self, level_name, message):
+        """Format log message with elapsed-time timestamp."""
+        elapsed = self._monotonic() - self.start_time
+        return f"[{elapsed:6.1f}s] {level_name}: {message}"
+    
+    def _format_plain(self, level_name, message):
+        """Format log message without timestamp."""
+        return f"{level_name}: {message}"
     
     def _log(self, level, level_name, message_or_callable):
         """Internal logging method with lazy evaluation support."""
-        if level.value <= self.level.value:
+        if level <= self.level:
             # If message is a callable, execute it to get the actual message
             if callable(message_or_callable):
                 message = message_or_callable()
@@ -55,14 +68,20 @@ class Logger:
     def set_level(self, level):
         """Change the logging level."""
         self.level = level
+        self._refresh_level_flags()
+    
+    def _refresh_level_flags(self):
+        """Cache level checks as plain attributes for guarding hot call sites."""
+        self.info_enabled = self.level >= LogLevel.INFO
+        self.debug_enabled = self.level >= LogLevel.DEBUG
     
     def is_debug_enabled(self):
         """Check if debug logging is enabled."""
-        return self.level.value >= LogLevel.DEBUG.value
+        return self.debug_enabled
     
     def is_info_enabled(self):
         """Check if info logging is enabled."""
-        return self.level.value >= LogLevel.INFO.value
+        return self.info_enabled
 
 # Global logger instance
 logger = Logger(level=LogLevel.INFO)
@@ -17,36 +17,70 @@ class MIDIManager:
             out_channel=0    # MIDI Channel 1
         )
         self.led_calibration_manager = get_led_calibration_manager()
+        
+        # Slider lookup tables keyed by CC number, built from the slider list
+        self._indexed_sliders = None
+        self._sliders_by_cc = {}
+        self._sliders_by_both_press_cc = {}
         logger.info("MIDI interface initialized")
     
     def send_control_change(self, cc_number, value):
         """Send a MIDI control change message."""
         self.midi.send(ControlChange(cc_number, value))
     
+    def send_many(self, messages):
+        """Send a list of MIDI messages in a single write to the port."""
+        try:
+            self.midi.send(messages)
+        except Exception as e:
+            logger.error(lazy_format("Failed to send {} MIDI messages: {}", len(messages), e))
+    
+    def _index_sliders(self, touch_sliders):
+        """Build CC number -> slider lookup tables for incoming messages."""
+        self._sliders_by_cc = {s.config["cc_number"]: s for s in touch_sliders}
+        self._sliders_by_both_press_cc = {
+            s.config["both_press_cc"]: s for s in touch_sliders
+            if s.config["both_press_cc"] is not None
+        }
+        self._indexed_sliders = touch_sliders
+    
     def receive_messages(self, touch_sliders, current_time=None):
-        """Process incoming MIDI messages and update sliders accordingly."""
+        """Process incoming MIDI messages and update sliders accordingly.
+        
+        Returns True if any message was received.
+        """
         msg = self.midi.receive()
-        midi_received = False
+        if msg is None:
+            return False
+        
+        if touch_sliders is not self._indexed_sliders:
+            self._index_sliders(touch_sliders)
         
+        # adafruit_midi returns concrete message classes, so an identity
+        # check against a local is enough (and cheaper than isinstance)
+        control_change = ControlChange
         while msg is not None:
-            midi_received = True
-            if isinstance(msg, ControlChange):
-                # Find matching slider
-                for slider in touch_sliders:
-                    if msg.control == slider.config["cc_number"]:
-                        slider.value = float(msg.value)
-                        slider.last_sent_value = msg.value
-                        if ENABLE_MIDI_LOGGING:
-                            logger.debug(lazy_format("MIDI In -> Slider (CC {}) = {}", msg.control, msg.value))
-                    elif msg.control == slider.config["both_press_cc"]:
-                        slider.both_pressed = msg.value >= 64
-                        if ENABLE_MIDI_LOGGING:
-                            logger.debug(lazy_format("MIDI In -> Button (CC {}) = {}", msg.control, msg.value))
+            if type(msg) is control_change:
+                # Look up the matching slider by CC number
+                slider = self._sliders_by_cc.get(msg.control)
+                if slider is not None:
+                    slider.value = msg.value
+                    slider.last_sent_value = msg.value
+                    slider.display_dirty = True
+                    if ENABLE_MIDI_LOGGING and logger.debug_enabled:
+                        logger.debug(f"MIDI In -> Slider (CC {msg.control}) = {msg.value}")
+                slider = self._sliders_by_both_press_cc.get(msg.control)
+                if slider is not None:
+                    slider.both_pressed = msg.value >= 64
+                    slider.display_dirty = True
+                    if ENABLE_MIDI_LOGGING and logger.debug_enabled:
+                        logger.debug(f"MIDI In -> Button (CC {msg.control}) = {msg.value}")
             msg = self.midi.receive()
         
-        # Notify LED calibration manager if MIDI was received
-        if midi_received and current_time is not None:
+        # Notify LED calibration manager that MIDI was received
+        if current_time is not None:
             self.led_calibration_manager.on_midi_received(current_time)
+        return True
     
     def get_interface(self):
         """Get the MIDI interface for use by other modules."""
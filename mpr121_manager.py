@@ -1,4 +1,6 @@
 import time
+import struct
+import asyncio
 import board
 import adafruit_mpr121
 from config import (
@@ -13,27 +15,74 @@ from logger import get_logger, LogLevel, lazy_format
 # Get logger instance
 logger = get_logger()
 
+# Debug logging flag, fixed for the run; code.py refreshes it after setting the log level
+_DBG = logger.is_debug_enabled()
+
+def refresh_debug_flag():
+    """Re-read the logger's debug setting after the log level changes."""
+    global _DBG
+    _DBG = logger.is_debug_enabled()
+
 # -----------------------------------------------------------------------------
 # I2C Bus Setup and Scanner
 # -----------------------------------------------------------------------------
 i2c = board.STEMMA_I2C()
 
+# Addresses seen by the last bus scan, reused until the next explicit scan
+_found_addrs_cache = None
+
+def _get_bus_scan(rescan=False):
+    """Return the set of addresses on the I2C bus, scanning only if not cached."""
+    global _found_addrs_cache
+    if _found_addrs_cache is None or rescan:
+        # Yield while another user holds the bus instead of spinning on it
+        while not i2c.try_lock():
+            time.sleep(0.001)
+        
+        try:
+            _found_addrs_cache = frozenset(i2c.scan())
+        finally:
+            i2c.unlock()
+    return _found_addrs_cache
+
 def scan_i2c():
     """Scan the I2C bus for connected devices and print their addresses."""
-    while not i2c.try_lock():
-        pass
+    found = sorted(_get_bus_scan(rescan=True))
+    if found:
+        suffix = "s" if len(found) > 1 else ""
+        logger.info(lazy_format("Found {} I2C device{}:", len(found), suffix))
+        for addr in found:
+            logger.info(lazy_format("  • 0x{:02X}", addr))
+    else:
+        logger.warn("No I2C devices found.")
 
-    try:
-        found = i2c.scan()
-        if found:
-            suffix = "s" if len(found) > 1 else ""
-            logger.info(lazy_format("Found {} I2C device{}:", len(found), suffix))
-            for addr in found:
-                logger.info(lazy_format("  • 0x{:02X}", addr))
-        else:
-            logger.warn("No I2C devices found.")
-    finally:
-        i2c.unlock()
+# -----------------------------------------------------------------------------
+# Board and Pin Layout
+# -----------------------------------------------------------------------------
+# SLIDERS is static, so group its pins by board address once at import instead
+# of rescanning the whole list for every board on each calibration pass.
+def _group_pins_by_addr(sliders):
+    """Map each MPR121 address to the tuple of pins its sliders use."""
+    pins_by_addr = {}
+    for config in sliders:
+        pins_by_addr.setdefault(config["mpr121_address"], []).extend(
+            (config["down_pin"], config["up_pin"]))
+    return {addr: tuple(pins) for addr, pins in pins_by_addr.items()}
+
+_PINS_BY_ADDR = _group_pins_by_addr(SLIDERS)
+_EXPECTED_ADDRS = frozenset(_PINS_BY_ADDR)
+
+# (boards dict, board count, (addr, mpr) pairs) for the last boards dict seen
+_boards_items_cache = (None, 0, ())
+
+def _boards_items(mpr121_boards):
+    """Return the (addr, mpr) pairs of mpr121_boards as a tuple, rebuilt only when it changes."""
+    global _boards_items_cache
+    boards, count, items = _boards_items_cache
+    if boards is not mpr121_boards or count != len(mpr121_boards):
+        items = tuple(mpr121_boards.items())
+        _boards_items_cache = (mpr121_boards, len(items), items)
+    return items
 
 # -----------------------------------------------------------------------------
 # LED Startup Calibration Management
@@ -84,14 +133,63 @@ def get_led_calibration_manager():
     """Get the global LED calibration manager."""
     return led_calibration_manager
 
+# -----------------------------------------------------------------------------
+# MPR121 Block Register Reads
+# -----------------------------------------------------------------------------
+MPR121_FILTDATA_0L = 0x04  # 12 x 16-bit little-endian filtered values
+MPR121_BASELINE_0 = 0x1E   # 12 x 8-bit baseline values (upper 8 of 10 bits)
+
+def _read_block(mpr, register, length):
+    """Read a contiguous block of MPR121 registers in a single I2C transfer."""
+    buf = bytearray(length)
+    # Same locked write-then-read the driver uses for its per-pin accessors
+    mpr._read_register_bytes(register, buf)
+    return buf
+
+def _read_electrode_data(mpr):
+    """Read baseline and filtered data for all 12 electrodes in two I2C transfers.
+    
+    Values are scaled like mpr.baseline_data(pin) / mpr.filtered_data(pin).
+    """
+    filtered = struct.unpack_from("<12H", _read_block(mpr, MPR121_FILTDATA_0L, 24))
+    baseline = [b << 2 for b in _read_block(mpr, MPR121_BASELINE_0, 12)]
+    return baseline, filtered
+
+def _sample_all_baselines(mpr, samples=5, delay=0.01):
+    """Sample the 12 raw baseline registers several times, one transfer per sample.
+    
+    Row n of the returned buffer holds sample n, so buf[pin::12] is one pin's readings.
+    """
+    buf = bytearray(samples * 12)
+    rows = memoryview(buf)
+    for n in range(samples):
+        mpr._read_register_bytes(MPR121_BASELINE_0, rows[n * 12:(n + 1) * 12])
+        time.sleep(delay)
+    return buf
+
 # -----------------------------------------------------------------------------
 # MPR121 Sensitivity Control Functions
 # -----------------------------------------------------------------------------
+# Thresholds the driver's reset() writes to every electrode
+MPR121_RESET_TOUCH_THRESHOLD = 12
+MPR121_RESET_RELEASE_THRESHOLD = 6
+
+# Last (touch, release) thresholds written per (board, pin), to skip redundant writes
+_last_thresholds = {}
+
+def reset_mpr121(mpr):
+    """Reset an MPR121 and record the thresholds the reset leaves on each pin."""
+    mpr.reset()
+    reset_thresholds = (MPR121_RESET_TOUCH_THRESHOLD, MPR121_RESET_RELEASE_THRESHOLD)
+    for pin in range(12):
+        _last_thresholds[(mpr, pin)] = reset_thresholds
+
 def test_threshold_configuration(mpr, pin):
     """Test if threshold configuration is working properly."""
     try:
         # Set a known threshold
         test_threshold = 20
+        _last_thresholds.pop((mpr, pin), None)
         mpr.touch_threshold(pin, test_threshold)
         
         # Read it back
@@ -115,38 +213,52 @@ def configure_mpr121_sensitivity(mpr, pin, touch_threshold=None, release_thresho
         if release_threshold is None:
             release_threshold = MPR121_DEFAULT_RELEASE_THRESHOLD
         
+        # Skip the I2C writes if the pin already holds these thresholds
+        key = (mpr, pin)
+        thresholds = (touch_threshold, release_threshold)
+        if _last_thresholds.get(key) == thresholds:
+            if _DBG:
+                logger.debug(lazy_format("  Pin {}: Touch={}, Release={} (unchanged)", pin, touch_threshold, release_threshold))
+            return True
+        
+        # Forget the old values first so a failed write is retried next time
+        _last_thresholds.pop(key, None)
+        
         # Set touch threshold (lower = more sensitive)
         mpr.touch_threshold(pin, touch_threshold)
         
         # Set release threshold (lower = faster release)
         mpr.release_threshold(pin, release_threshold)
         
-        logger.debug(lazy_format("  Pin {}: Touch={}, Release={}", pin, touch_threshold, release_threshold))
+        _last_thresholds[key] = thresholds
+        if _DBG:
+            logger.debug(lazy_format("  Pin {}: Touch={}, Release={}", pin, touch_threshold, release_threshold))
         return True
         
     except Exception as e:
         logger.error(lazy_format("Error configuring sensitivity for pin {}: {}", pin, e))
         return False
 
-def check_baseline_stability(mpr, pin, samples=5):
-    """Check if baseline is stable by taking multiple readings."""
-    try:
-        readings = []
-        for _ in range(samples):
-            readings.append(mpr.baseline_data(pin))
-            time.sleep(0.01)
-        
-        variation = max(readings) - min(readings)
-        return variation < 5, variation  # Stable if variation < 5
-    except Exception as e:
-        logger.error(lazy_format("Error checking baseline stability for pin {}: {}", pin, e))
-        return False, 0
+def check_baseline_stability(baseline_samples, pin):
+    """Check if a pin's baseline is stable across samples from _sample_all_baselines()."""
+    # Single pass over the pin's column, tracking the range without slicing it out
+    lo = hi = baseline_samples[pin]
+    for i in range(pin + 12, len(baseline_samples), 12):
+        v = baseline_samples[i]
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    
+    # Scale like mpr.baseline_data(pin) so the threshold keeps its meaning
+    variation = (hi - lo) << 2
+    return variation < 5, variation  # Stable if variation < 5
 
-def allow_calibration_time(mpr, pin, duration=0.2):
+async def allow_calibration_time(mpr, pin, duration=0.2):
     """Allow time for baseline calibration and check if it stabilizes."""
     try:
         start_baseline = mpr.baseline_data(pin)
-        time.sleep(duration)
+        await asyncio.sleep(duration)
         end_baseline = mpr.baseline_data(pin)
         
         # Check if baseline has stabilized
@@ -160,173 +272,196 @@ def monitor_calibration_health(mpr, addr):
     """Monitor MPR121 calibration health for all pins."""
     logger.info(lazy_format("MPR121 0x{:02X} Calibration Health:", addr))
     
-    for config in SLIDERS:
-        if config["mpr121_address"] == addr:
-            for pin in [config["down_pin"], config["up_pin"]]:
-                try:
-                    baseline = mpr.baseline_data(pin)
-                    filtered = mpr.filtered_data(pin)
-                    delta = baseline - filtered
-                    
-                    # Check baseline stability
-                    is_stable, variation = check_baseline_stability(mpr, pin)
-                    
-                    # Check calibration health
-                    health_status = "Healthy"
-                    warnings = []
-                    
-                    if baseline < 50 or baseline > 200:
-                        health_status = "WARNING"
-                        warnings.append(lazy_format("Baseline out of normal range ({})", baseline))
-                    
-                    if delta > 50:
-                        health_status = "WARNING"
-                        warnings.append(lazy_format("Large delta detected ({})", delta))
-                    
-                    if not is_stable:
-                        health_status = "WARNING"
-                        warnings.append(lazy_format("Unstable baseline (variation: {})", variation))
-                    
-                    # Log status based on health
-                    if health_status == "Healthy":
-                        logger.debug(lazy_format("  Pin {}: {} - Baseline={}, Filtered={}, Delta={}, Stable={}", 
-                                               pin, health_status, baseline, filtered, delta, is_stable))
-                    else:
-                        logger.warn(lazy_format("  Pin {}: {} - Baseline={}, Filtered={}, Delta={}, Stable={}", 
-                                              pin, health_status, baseline, filtered, delta, is_stable))
-                    
-                    if warnings:
-                        for warning in warnings:
-                            logger.warn(lazy_format("    ⚠️  {}", warning))
-                    
-                except Exception as e:
-                    logger.error(lazy_format("  Pin {}: ERROR - {}", pin, e))
+    try:
+        baselines, filtered_values = _read_electrode_data(mpr)
+        # Sample every pin together; each pin's stability is sliced from the same rows
+        baseline_samples = _sample_all_baselines(mpr)
+    except Exception as e:
+        logger.error(lazy_format("  Error reading electrode data: {}", e))
+        return
+    
+    for pin in _PINS_BY_ADDR.get(addr, ()):
+        try:
+            baseline = baselines[pin]
+            filtered = filtered_values[pin]
+            delta = baseline - filtered
+            
+            # Check baseline stability
+            is_stable, variation = check_baseline_stability(baseline_samples, pin)
+            
+            # Check calibration health
+            health_status = "Healthy"
+            warnings = []
+            
+            if baseline < 50 or baseline > 200:
+                health_status = "WARNING"
+                warnings.append(lazy_format("Baseline out of normal range ({})", baseline))
+            
+            if delta > 50:
+                health_status = "WARNING"
+                warnings.append(lazy_format("Large delta detected ({})", delta))
+            
+            if not is_stable:
+                health_status = "WARNING"
+                warnings.append(lazy_format("Unstable baseline (variation: {})", variation))
+            
+            # Log status based on health
+            if health_status == "Healthy":
+                if _DBG:
+                    logger.debug(lazy_format("  Pin {}: {} - Baseline={}, Filtered={}, Delta={}, Stable={}", 
+                                           pin, health_status, baseline, filtered, delta, is_stable))
+            else:
+                logger.warn(lazy_format("  Pin {}: {} - Baseline={}, Filtered={}, Delta={}, Stable={}", 
+                                      pin, health_status, baseline, filtered, delta, is_stable))
+            
+            if warnings:
+                for warning in warnings:
+                    logger.warn(lazy_format("    ⚠️  {}", warning))
+            
+        except Exception as e:
+            logger.error(lazy_format("  Pin {}: ERROR - {}", pin, e))
 
 def log_sensitivity_data(mpr, addr):
     """Log sensitivity data for debugging."""
+    # Everything below is debug output, including the register reads
+    if not _DBG:
+        return
+    
     logger.debug(lazy_format("MPR121 0x{:02X} Sensitivity Data:", addr))
-    for config in SLIDERS:
-        if config["mpr121_address"] == addr:
-            for pin in [config["down_pin"], config["up_pin"]]:
-                try:
-                    baseline = mpr.baseline_data(pin)
-                    filtered = mpr.filtered_data(pin)
-                    touch_thresh = mpr.touch_threshold(pin)
-                    release_thresh = mpr.release_threshold(pin)
-                    logger.debug(lazy_format("  Pin {}: Baseline={}, Filtered={}, Touch={}, Release={}", 
-                                           pin, baseline, filtered, touch_thresh, release_thresh))
-                except Exception as e:
-                    logger.error(lazy_format("  Pin {}: Error reading data - {}", pin, e))
+    
+    try:
+        baselines, filtered_values = _read_electrode_data(mpr)
+    except Exception as e:
+        logger.error(lazy_format("  Error reading electrode data: {}", e))
+        return
+    
+    for pin in _PINS_BY_ADDR.get(addr, ()):
+        try:
+            baseline = baselines[pin]
+            filtered = filtered_values[pin]
+            touch_thresh = mpr.touch_threshold(pin)
+            release_thresh = mpr.release_threshold(pin)
+            logger.debug(lazy_format("  Pin {}: Baseline={}, Filtered={}, Touch={}, Release={}", 
+                                   pin, baseline, filtered, touch_thresh, release_thresh))
+        except Exception as e:
+            logger.error(lazy_format("  Pin {}: Error reading data - {}", pin, e))
+
+async def _configure_board(addr, mpr):
+    """Reset and configure sensitivity for a single MPR121 board."""
+    logger.info(lazy_format("Configuring MPR121 at 0x{:02X}", addr))
+    
+    # Reset and wait for stabilization
+    try:
+        reset_mpr121(mpr)
+        await asyncio.sleep(0.2)
+        logger.debug(lazy_format("  0x{:02X}: Reset completed", addr))
+    except Exception as e:
+        logger.error(lazy_format("  0x{:02X}: Error during reset: {}", addr, e))
+        return
+    
+    # Allow initial calibration time
+    logger.debug(lazy_format("  0x{:02X}: Allowing initial calibration time...", addr))
+    await asyncio.sleep(0.5)  # Give extra time for baseline stabilization
+    
+    # Configure each pin with error checking
+    pins_configured = 0
+    for pin in _PINS_BY_ADDR.get(addr, ()):
+        try:
+            # Test threshold configuration
+            if not test_threshold_configuration(mpr, pin) and _DBG:
+                logger.debug(lazy_format("  0x{:02X}: Using default configuration for pin {}", addr, pin))
+            
+            # Configure sensitivity with default thresholds
+            if configure_mpr121_sensitivity(mpr, pin):
+                pins_configured += 1
+            
+            # Allow calibration time for this pin
+            is_stable, start_baseline, end_baseline = await allow_calibration_time(mpr, pin)
+            if not is_stable and _DBG:
+                logger.debug(lazy_format("  0x{:02X} Pin {}: Baseline still adjusting ({} -> {})", 
+                                       addr, pin, start_baseline, end_baseline))
+            
+        except Exception as e:
+            logger.error(lazy_format("  0x{:02X}: Error configuring pin {}: {}", addr, pin, e))
+    
+    logger.info(lazy_format("  0x{:02X}: Successfully configured {} pins", addr, pins_configured))
+    
+    # Monitor calibration health
+    monitor_calibration_health(mpr, addr)
+    
+    # Log sensitivity data
+    log_sensitivity_data(mpr, addr)
+
+async def setup_mpr121_sensitivity_async(mpr121_boards):
+    """Configure all boards concurrently so their stabilization delays overlap."""
+    await asyncio.gather(*[_configure_board(addr, mpr) for addr, mpr in _boards_items(mpr121_boards)])
 
 def setup_mpr121_sensitivity(mpr121_boards):
     """Setup MPR121 sensitivity with error checking for all boards."""
     logger.info("MPR121 Sensitivity Configuration")
+    asyncio.run(setup_mpr121_sensitivity_async(mpr121_boards))
+
+async def _recalibrate_board(addr, mpr):
+    """Re-calibrate a single MPR121 board after LED startup."""
+    logger.info(lazy_format("Re-calibrating MPR121 at 0x{:02X}", addr))
     
-    for addr, mpr in mpr121_boards.items():
-        logger.info(lazy_format("Configuring MPR121 at 0x{:02X}", addr))
-        
-        # Reset and wait for stabilization
-        try:
-            mpr.reset()
-            time.sleep(0.2)
-            logger.debug("  Reset completed")
-        except Exception as e:
-            logger.error(lazy_format("  Error during reset: {}", e))
-            continue
+    try:
+        # Reset the MPR121 to clear any interference effects
+        reset_mpr121(mpr)
+        await asyncio.sleep(0.3)  # Give extra time for reset and stabilization
+        logger.debug(lazy_format("  0x{:02X}: Reset completed", addr))
         
-        # Allow initial calibration time
-        logger.debug("  Allowing initial calibration time...")
-        time.sleep(0.5)  # Give extra time for baseline stabilization
+        # Allow extended calibration time for LED interference to stabilize
+        logger.debug(lazy_format("  0x{:02X}: Allowing extended calibration time for LED interference...", addr))
+        await asyncio.sleep(1.0)  # Extended time for baseline stabilization
         
-        # Configure each pin with error checking
+        # Re-configure each pin
         pins_configured = 0
-        for config in SLIDERS:
-            if config["mpr121_address"] == addr:
-                for pin in [config["down_pin"], config["up_pin"]]:
-                    try:
-                        # Test threshold configuration
-                        if not test_threshold_configuration(mpr, pin):
-                            logger.debug(lazy_format("  Using default configuration for pin {}", pin))
-                        
-                        # Configure sensitivity with default thresholds
-                        if configure_mpr121_sensitivity(mpr, pin):
-                            pins_configured += 1
-                        
-                        # Allow calibration time for this pin
-                        is_stable, start_baseline, end_baseline = allow_calibration_time(mpr, pin)
-                        if not is_stable:
-                            logger.debug(lazy_format("  Pin {}: Baseline still adjusting ({} -> {})", 
-                                                   pin, start_baseline, end_baseline))
-                        
-                    except Exception as e:
-                        logger.error(lazy_format("  Error configuring pin {}: {}", pin, e))
+        for pin in _PINS_BY_ADDR.get(addr, ()):
+            try:
+                # Configure sensitivity with default thresholds
+                if configure_mpr121_sensitivity(mpr, pin):
+                    pins_configured += 1
+                
+                # Allow calibration time for this pin
+                is_stable, start_baseline, end_baseline = await allow_calibration_time(mpr, pin, duration=0.5)
+                if not is_stable and _DBG:
+                    logger.debug(lazy_format("  0x{:02X} Pin {}: Baseline adjusting with LED interference ({} -> {})", 
+                                           addr, pin, start_baseline, end_baseline))
+                
+            except Exception as e:
+                logger.error(lazy_format("  0x{:02X}: Error re-configuring pin {}: {}", addr, pin, e))
         
-        logger.info(lazy_format("  Successfully configured {} pins", pins_configured))
+        logger.info(lazy_format("  0x{:02X}: Successfully re-configured {} pins", addr, pins_configured))
         
-        # Monitor calibration health
+        # Monitor calibration health after LED startup
         monitor_calibration_health(mpr, addr)
         
-        # Log sensitivity data
-        log_sensitivity_data(mpr, addr)
+    except Exception as e:
+        logger.error(lazy_format("  Error during LED startup calibration for MPR121 0x{:02X}: {}", addr, e))
+
+async def perform_led_startup_calibration_async(mpr121_boards):
+    """Re-calibrate all boards concurrently so their stabilization delays overlap."""
+    await asyncio.gather(*[_recalibrate_board(addr, mpr) for addr, mpr in _boards_items(mpr121_boards)])
 
 def perform_led_startup_calibration(mpr121_boards):
     """Perform calibration after LED startup to handle electrical interference."""
     logger.info("=== LED Startup Calibration ===")
     logger.info("Re-calibrating MPR121 sensors after LED startup...")
-    
-    for addr, mpr in mpr121_boards.items():
-        logger.info(lazy_format("Re-calibrating MPR121 at 0x{:02X}", addr))
-        
-        try:
-            # Reset the MPR121 to clear any interference effects
-            mpr.reset()
-            time.sleep(0.3)  # Give extra time for reset and stabilization
-            logger.debug("  Reset completed")
-            
-            # Allow extended calibration time for LED interference to stabilize
-            logger.debug("  Allowing extended calibration time for LED interference...")
-            time.sleep(1.0)  # Extended time for baseline stabilization
-            
-            # Re-configure each pin
-            pins_configured = 0
-            for config in SLIDERS:
-                if config["mpr121_address"] == addr:
-                    for pin in [config["down_pin"], config["up_pin"]]:
-                        try:
-                            # Configure sensitivity with default thresholds
-                            if configure_mpr121_sensitivity(mpr, pin):
-                                pins_configured += 1
-                            
-                            # Allow calibration time for this pin
-                            is_stable, start_baseline, end_baseline = allow_calibration_time(mpr, pin, duration=0.5)
-                            if not is_stable:
-                                logger.debug(lazy_format("  Pin {}: Baseline adjusting with LED interference ({} -> {})", 
-                                                       pin, start_baseline, end_baseline))
-                            
-                        except Exception as e:
-                            logger.error(lazy_format("  Error re-configuring pin {}: {}", pin, e))
-            
-            logger.info(lazy_format("  Successfully re-configured {} pins", pins_configured))
-            
-            # Monitor calibration health after LED startup
-            monitor_calibration_health(mpr, addr)
-            
-        except Exception as e:
-            logger.error(lazy_format("  Error during LED startup calibration for MPR121 0x{:02X}: {}", addr, e))
-    
+    asyncio.run(perform_led_startup_calibration_async(mpr121_boards))
     logger.info("LED startup calibration completed")
 
 def periodic_calibration_check(mpr121_boards):
     """Perform periodic calibration health check (can be called during operation)."""
     logger.info("Periodic Calibration Health Check")
     
-    for addr, mpr in mpr121_boards.items():
+    for addr, mpr in _boards_items(mpr121_boards):
         monitor_calibration_health(mpr, addr)
 
 def initialize_mpr121_boards():
     """Initialize all MPR121 boards and return the board dictionary with robust error handling."""
     mpr121_boards = {}
-    expected_addresses = set(slider["mpr121_address"] for slider in SLIDERS)
+    expected_addresses = _EXPECTED_ADDRS
     successful_initializations = 0
     failed_initializations = 0
     
@@ -348,16 +483,18 @@ def initialize_mpr121_boards():
             
             # Configure touch thresholds
             try:
-                mpr.reset()
+                reset_mpr121(mpr)
                 time.sleep(0.1)
                 logger.debug(lazy_format("  Reset completed for 0x{:02X}", addr))
             except Exception as e:
                 logger.warn(lazy_format("  Reset failed for 0x{:02X}: {}", addr, e))
             
             # Debug: Print baseline data
-            if logger.is_debug_enabled():
+            if _DBG:
                 try:
-                    baseline = [(i, mpr.baseline_data(i), mpr.filtered_data(i)) for i in range(12)]
+                    # Two block reads instead of 24 per-pin register reads
+                    baselines, filtered_values = _read_electrode_data(mpr)
+                    baseline = list(zip(range(12), baselines, filtered_values))
                     logger.debug(lazy_format("MPR121 0x{:02X} baseline data: {}", addr, baseline))
                 except Exception as e:
                     logger.warn(lazy_format("  Could not read baseline data for 0x{:02X}: {}", addr, e))
@@ -371,6 +508,9 @@ def initialize_mpr121_boards():
             logger.error(lazy_format("Unexpected error initializing MPR121 at 0x{:02X}: {}", addr, err))
             failed_initializations += 1
     
+    # Build the cached board tuple used by the calibration routines
+    _boards_items(mpr121_boards)
+    
     # Summary
     logger.info(lazy_format("MPR121 initialization complete: {} successful, {} failed", 
                            successful_initializations, failed_initializations))
@@ -387,22 +527,13 @@ def initialize_mpr121_boards():
 def _test_mpr121_i2c_communication(addr):
     """Test if I2C communication works for a specific MPR121 address."""
     try:
-        # Try to lock the I2C bus
-        if not i2c.try_lock():
-            logger.warn("Could not lock I2C bus for MPR121 test")
+        # Consult the cached bus scan rather than probing the whole bus per address
+        if addr in _get_bus_scan():
+            logger.debug(lazy_format("MPR121 found at 0x{:02X}", addr))
+            return True
+        else:
+            logger.debug(lazy_format("No device found at 0x{:02X}", addr))
             return False
-        
-        try:
-            # Scan for devices
-            found = i2c.scan()
-            if addr in found:
-                logger.debug(lazy_format("MPR121 found at 0x{:02X}", addr))
-                return True
-            else:
-                logger.debug(lazy_format("No device found at 0x{:02X}", addr))
-                return False
-        finally:
-            i2c.unlock()
             
     except Exception as e:
         logger.error(lazy_format("I2C communication test failed for 0x{:02X}: {}", addr, e))
@@ -410,7 +541,7 @@ def _test_mpr121_i2c_communication(addr):
 
 def get_mpr121_status(mpr121_boards):
     """Get status information about MPR121 boards."""
-    expected_addresses = set(slider["mpr121_address"] for slider in SLIDERS)
+    expected_addresses = _EXPECTED_ADDRS
     connected_addresses = set(mpr121_boards.keys())
     missing_addresses = expected_addresses - connected_addresses
     
@@ -2,40 +2,96 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+import heapq
+import itertools
+import queue
+import threading
 import urwid
 import mido
 from mido import Message
 from config import SLIDERS, ALL_BOTH_PRESS_TOGGLE_ENABLED, ALL_BOTH_PRESS_CC_NUMBER
+from logger import get_logger, lazy_format
 import time
 
+# Get logger instance
+logger = get_logger()
+
 print(mido.get_output_names())
 
-# Mock MPR121 class for CLI
-class MockMPR121:
-    def __init__(self):
-        self.touched_pins = [False] * 12
-
-# Simple debouncer stub for CLI (no real debounce)
-class SimpleDebouncer:
-    def __init__(self, fn):
-        self.fn = fn
-    def update(self):
-        pass
-    @property
-    def value(self):
-        return self.fn()
-
-# MIDI interface using mido
+# Activity labels indexed by SliderState.activity_on
+_ACT = ("OFF", "ON")
+# Value cell text for every MIDI value
+_VALUE_STRS = tuple("Value: %3d | " % v for v in range(128))
+
+# Output port for slider value CCs
+MIDI_PORT_NAME = 'MadMapper In'
+# Optional second output port for activity and both-press CCs, so they don't
+# queue behind value CCs; None sends everything through MIDI_PORT_NAME
+ACTIVITY_PORT_NAME = None
+
+# MIDI interface using mido; a background thread per port does the I/O so a
+# blocking backend cannot stall the UI
 class MidiInterface:
-    def __init__(self, port_name=None):
+    def __init__(self, port_name=None, activity_port_name=None):
         self.port = mido.open_output(port_name) if port_name else mido.open_output()
+        self.q = self._start_sender(self.port)
+        if activity_port_name:
+            self.activity_port = mido.open_output(activity_port_name)
+            self.activity_q = self._start_sender(self.activity_port)
+        else:
+            self.activity_port = self.port
+            self.activity_q = self.q
+    def _start_sender(self, port):
+        q = queue.SimpleQueue()
+        threading.Thread(target=self._worker, args=(port, q), daemon=True).start()
+        return q
     def send(self, msg):
-        self.port.send(msg)
+        # Messages are sent later, so callers must not mutate msg after queueing it
+        self.q.put(msg)
+    def send_activity(self, msg):
+        """Queue an activity/both-press CC on the activity port (the main port if none)."""
+        self.activity_q.put(msg)
+    def _worker(self, port, q):
+        while True:
+            msg = q.get()
+            try:
+                port.send(msg)
+            except Exception as e:
+                # Keep the sender alive so one bad write doesn't silence the port
+                logger.error(lazy_format("Failed to send MIDI message {}: {}", msg, e))
+
+# Hold counts covered by the precomputed step table; past the last entry the
+# slider has long since hit the end of its range
+STEP_TABLE_SIZE = 128
+
+# Slider values are Q8 fixed point (value << 8) so fractional steps stay integer math
+Q8_SHIFT = 8
+Q8_MAX = 127 << Q8_SHIFT
+
+def to_q8(x):
+    return int(round(x * (1 << Q8_SHIFT)))
 
 class SliderState:
-    def __init__(self, config):
+    __slots__ = (
+        "config", "cc_number", "both_press_cc", "activity_cc", "step_table", "index",
+        "value_q8", "last_sent_value", "both_pressed",
+        "hold_count_down", "hold_count_up", "enabled", "activity_on", "last_activity_time",
+        "dirty", "pending_value", "last_emit_time",
+    )
+
+    def __init__(self, config, index=0):
         self.config = config
-        self.value = float(config["initial_value"])
+        self.index = index  # Bit position in the all-both-press masks
+        # Config values used on every key event, hoisted out of the config dict
+        self.cc_number = config["cc_number"]
+        self.both_press_cc = config["both_press_cc"]
+        self.activity_cc = config.get("activity_channel_cc")
+        # step_table[n] is the Q8 step for the n-th autorepeat of a held key (index 0 unused)
+        speed = config["speed"]
+        accel_rate = config["accel_rate"]
+        self.step_table = tuple([to_q8(config["speed_initial"])] * 2 +
+                                [to_q8(speed + accel_rate * i) for i in range(2, STEP_TABLE_SIZE)])
+        self.value_q8 = int(config["initial_value"]) << Q8_SHIFT
         self.last_sent_value = config["initial_value"]
         self.both_pressed = False
         self.hold_count_down = 0
@@ -43,49 +99,94 @@ class SliderState:
         self.enabled = True
         self.activity_on = False
         self.last_activity_time = time.monotonic()
+        # Value CC coalescing: the latest unsent value waits for the next flush
+        self.dirty = False
+        self.pending_value = self.last_sent_value
+        self.last_emit_time = 0.0
 
 class SliderWidget(urwid.WidgetWrap):
     ACTIVITY_TIMEOUT = 0.5  # seconds
+    SEND_INTERVAL = 0.01  # minimum seconds between value CCs; faster changes are coalesced
 
-    def __init__(self, slider_state, midi_interface):
+    def __init__(self, slider_state, midi_interface, schedule_off=None, both_press_manager=None):
         self.slider_state = slider_state
         self.midi = midi_interface
+        self.schedule_off = schedule_off  # called with (deadline, widget) when activity turns on
+        self.both_press_manager = both_press_manager  # told when both_pressed flips
         self.focused = False
-        self.text_widget = urwid.Text(self._get_text())
-        super().__init__(self.text_widget)
-
-    def _get_text(self):
-        s = self.slider_state
-        focus_marker = ">" if self.focused else " "
-        return f"{focus_marker} CC {s.config['cc_number']:2d} | Value: {int(s.value):3d} | Both: {'Y' if s.both_pressed else 'N'} | Activity: {'ON' if s.activity_on else 'OFF'}"
+        cc = slider_state.cc_number
+        both_cc = slider_state.both_press_cc
+        act_cc = slider_state.activity_cc
+        # Build the CC messages once: one per value for the slider CC, since
+        # queued messages must not be mutated before the sender thread runs
+        self._msg_values = tuple(Message('control_change', channel=0, control=cc, value=v) for v in range(128))
+        if both_cc is not None:
+            self._msg_both_on = Message('control_change', channel=0, control=both_cc, value=127)
+            self._msg_both_off = Message('control_change', channel=0, control=both_cc, value=0)
+        if act_cc is not None:
+            self._msg_act_on = Message('control_change', channel=0, control=act_cc, value=127)
+            self._msg_act_off = Message('control_change', channel=0, control=act_cc, value=0)
+        # The row is split into cells so a change only re-renders its own cell;
+        # every cell text is formatted up front
+        self._focus_strs = tuple("%s CC %2d | " % (mark, cc) for mark in " >")
+        self._both_act_strs = tuple(tuple("Both: %s | Activity: %s" % (both, act) for act in _ACT)
+                                    for both in "NY")
+        s = slider_state
+        self._shown = [self.focused, s.value_q8 >> Q8_SHIFT, s.both_pressed, s.activity_on]
+        self._t_focus = urwid.Text(self._focus_strs[self.focused])
+        self._t_value = urwid.Text(_VALUE_STRS[self._shown[1]])
+        self._t_both_activity = urwid.Text(self._both_act_strs[s.both_pressed][s.activity_on])
+        super().__init__(urwid.Columns([("pack", self._t_focus), ("pack", self._t_value),
+                                        ("pack", self._t_both_activity)]))
 
     def set_focus(self, focused):
         self.focused = focused
-        self.text_widget.set_text(self._get_text())
+        self.update_display()
 
     def update_display(self):
-        self.text_widget.set_text(self._get_text())
+        # Only touch (and so invalidate) the cells whose field changed
+        s = self.slider_state
+        shown = self._shown
+        if self.focused != shown[0]:
+            shown[0] = self.focused
+            self._t_focus.set_text(self._focus_strs[self.focused])
+        value = s.value_q8 >> Q8_SHIFT
+        if value != shown[1]:
+            shown[1] = value
+            self._t_value.set_text(_VALUE_STRS[value])
+        if s.both_pressed != shown[2] or s.activity_on != shown[3]:
+            shown[2] = s.both_pressed
+            shown[3] = s.activity_on
+            self._t_both_activity.set_text(self._both_act_strs[s.both_pressed][s.activity_on])
 
-    def move_up(self):
+    def move_up(self, count, now):
+        """Apply count key repeats, then send and redraw once."""
         s = self.slider_state
         if not s.enabled or s.both_pressed:
             return
-        s.hold_count_up += 1
-        step = (s.config["speed_initial"] if s.hold_count_up == 1 else s.config["speed"] + (s.config["accel_rate"] * s.hold_count_up))
-        s.value = min(127, s.value + step)
-        self._send_value()
-        self.activity_ping()
+        value = s.value_q8
+        for _ in range(count):
+            s.hold_count_up += 1
+            hold = s.hold_count_up
+            value = min(Q8_MAX, value + s.step_table[min(hold, STEP_TABLE_SIZE - 1)])
+        s.value_q8 = value
+        self._send_value(now)
+        self.activity_ping(now)
         self.update_display()
 
-    def move_down(self):
+    def move_down(self, count, now):
+        """Apply count key repeats, then send and redraw once."""
         s = self.slider_state
         if not s.enabled or s.both_pressed:
             return
-        s.hold_count_down += 1
-        step = (s.config["speed_initial"] if s.hold_count_down == 1 else s.config["speed"] + (s.config["accel_rate"] * s.hold_count_down))
-        s.value = max(0, s.value - step)
-        self._send_value()
-        self.activity_ping()
+        value = s.value_q8
+        for _ in range(count):
+            s.hold_count_down += 1
+            hold = s.hold_count_down
+            value = max(0, value - s.step_table[min(hold, STEP_TABLE_SIZE - 1)])
+        s.value_q8 = value
+        self._send_value(now)
+        self.activity_ping(now)
         self.update_display()
 
     def reset_holds(self):
@@ -93,57 +194,92 @@ class SliderWidget(urwid.WidgetWrap):
         s.hold_count_up = 0
         s.hold_count_down = 0
 
-    def both_press(self):
+    def both_press(self, now):
         s = self.slider_state
-        if not s.both_pressed and s.config["both_press_cc"] is not None:
-            self.midi.send(Message('control_change', channel=0, control=s.config["both_press_cc"], value=127))
+        if not s.both_pressed and s.both_press_cc is not None:
+            self.midi.send_activity(self._msg_both_on)
             s.both_pressed = True
-            self.activity_ping()
+            if self.both_press_manager is not None:
+                self.both_press_manager.set_both_pressed(s.index, True)
+            self.activity_ping(now)
             self.update_display()
 
-    def both_release(self):
+    def both_release(self, now):
         s = self.slider_state
-        if s.both_pressed and s.config["both_press_cc"] is not None:
-            self.midi.send(Message('control_change', channel=0, control=s.config["both_press_cc"], value=0))
+        if s.both_pressed and s.both_press_cc is not None:
+            self.midi.send_activity(self._msg_both_off)
             s.both_pressed = False
-            self.activity_ping()
+            if self.both_press_manager is not None:
+                self.both_press_manager.set_both_pressed(s.index, False)
+            was_active = s.activity_on
+            self.activity_ping(now)
+            # The timeout just dropped from the both-press one, so the deadline
+            # scheduled when activity turned on is too late; queue the new one
+            if was_active and self.schedule_off:
+                self.schedule_off(now + self.ACTIVITY_TIMEOUT, self)
             self.update_display()
 
-    def _send_value(self):
+    def _send_value(self, now):
+        s = self.slider_state
+        new_value = s.value_q8 >> Q8_SHIFT
+        if new_value == s.last_sent_value:
+            # Back at the value already sent, so drop any coalesced one
+            s.pending_value = new_value
+            s.dirty = False
+        else:
+            s.pending_value = new_value
+            s.dirty = True
+            # Send right away unless a value went out very recently; key
+            # autorepeat bursts are left for flush_pending() to send once
+            if now - s.last_emit_time > self.SEND_INTERVAL:
+                self.flush_pending(now)
+
+    def flush_pending(self, now):
+        """Send the latest coalesced value CC, if one is waiting."""
         s = self.slider_state
-        new_value = int(s.value)
-        if new_value != s.last_sent_value:
-            #print(f"Sending CC {s.config['cc_number']} value {new_value}")
-            self.midi.send(Message('control_change', channel=0, control=s.config["cc_number"], value=new_value))
-            s.last_sent_value = new_value
+        if s.dirty:
+            #print(f"Sending CC {s.cc_number} value {s.pending_value}")
+            self.midi.send(self._msg_values[s.pending_value])
+            s.last_sent_value = s.pending_value
+            s.last_emit_time = now
+            s.dirty = False
+
+    def _activity_timeout(self):
+        # Use longer timeout if both_pressed is active
+        return 10.0 if self.slider_state.both_pressed else self.ACTIVITY_TIMEOUT
 
-    def activity_ping(self):
+    def activity_ping(self, now):
         s = self.slider_state
-        s.last_activity_time = time.monotonic()
-        activity_cc = s.config.get("activity_channel_cc")
-        if activity_cc is not None and not s.activity_on:
-            self.midi.send(Message('control_change', channel=0, control=activity_cc, value=127))
+        s.last_activity_time = now
+        if s.activity_cc is not None and not s.activity_on:
+            self.midi.send_activity(self._msg_act_on)
             s.activity_on = True
             self.update_display()
+            if self.schedule_off:
+                self.schedule_off(s.last_activity_time + self._activity_timeout(), self)
 
-    def activity_check(self):
+    def activity_check(self, now):
+        """Turn activity off if it timed out; return the new deadline if still active."""
         s = self.slider_state
-        activity_cc = s.config.get("activity_channel_cc")
-        # Use longer timeout if both_pressed is active
-        timeout = 10.0 if s.both_pressed else self.ACTIVITY_TIMEOUT
-        if activity_cc is not None and s.activity_on:
-            if (time.monotonic() - s.last_activity_time) > timeout:
-                self.midi.send(Message('control_change', channel=0, control=activity_cc, value=0))
+        if s.activity_cc is not None and s.activity_on:
+            deadline = s.last_activity_time + self._activity_timeout()
+            if now > deadline:
+                self.midi.send_activity(self._msg_act_off)
                 s.activity_on = False
                 self.update_display()
+            else:
+                return deadline
+        return None
 
 class AllBothPressManager:
     """Simple version of AllBothPressManager for the test tool."""
     
-    def __init__(self, midi_interface):
+    def __init__(self, midi_interface, slider_states):
         self.midi = midi_interface
         self.enabled = ALL_BOTH_PRESS_TOGGLE_ENABLED
         self.cc_number = ALL_BOTH_PRESS_CC_NUMBER
+        self._on_msg = Message('control_change', channel=0, control=self.cc_number, value=127)
+        self._off_msg = Message('control_change', channel=0, control=self.cc_number, value=0)
         
         # State tracking
         self.all_both_pressed = False
@@ -152,6 +288,12 @@ class AllBothPressManager:
         self.toggle_start_time = None
         self.last_trigger_time = 0
         
+        # Bit i is set while slider i is both-pressed / enabled, so the
+        # all-pressed check is a single int compare
+        self.pressed_mask = 0
+        self.enabled_mask = 0
+        self.set_enabled(slider_states)
+        
         # Timing configuration (simplified for test tool)
         self.stable_time = 3.0
         self.min_duration = 10.0
@@ -159,17 +301,31 @@ class AllBothPressManager:
         self.cooldown = 60.0
         
         if self.enabled:
-            print(f"All Both-Press Toggle enabled (CC {self.cc_number})")
+            logger.info(lazy_format("All Both-Press Toggle enabled (CC {})", self.cc_number))
+        else:
+            logger.info("All Both-Press Toggle disabled")
+    
+    def set_enabled(self, slider_states):
+        """Rebuild the enabled mask, e.g. after a slider is disabled."""
+        self.enabled_mask = 0
+        for s in slider_states:
+            if s.enabled:
+                self.enabled_mask |= 1 << s.index
+    
+    def set_both_pressed(self, index, pressed):
+        """Record a slider's both-press flag in the pressed mask."""
+        if pressed:
+            self.pressed_mask |= 1 << index
         else:
-            print("All Both-Press Toggle disabled")
+            self.pressed_mask &= ~(1 << index)
     
-    def update(self, slider_states, current_time):
+    def update(self, current_time):
         """Update the all both-press state based on current slider states."""
-        if not self.enabled or not slider_states:
+        if not self.enabled or not self.enabled_mask:
             return False
         
-        # Check if all sliders are in both-press state
-        all_both_pressed_now = all(s.both_pressed for s in slider_states if s.enabled)
+        # Check if all enabled sliders are in both-press state
+        all_both_pressed_now = (self.pressed_mask & self.enabled_mask) == self.enabled_mask
         
         # State change detection
         if all_both_pressed_now != self.all_both_pressed:
@@ -178,11 +334,11 @@ class AllBothPressManager:
             if self.all_both_pressed:
                 # All sliders just entered both-press state
                 self.stable_start_time = current_time
-                print("All sliders entered both-press state - starting stable timer")
+                logger.debug("All sliders entered both-press state - starting stable timer")
             else:
                 # At least one slider left both-press state
                 self.stable_start_time = None
-                print("At least one slider left both-press state - resetting stable timer")
+                logger.debug("At least one slider left both-press state - resetting stable timer")
         
         # Check if we should trigger the toggle
         if (self.all_both_pressed and 
@@ -198,10 +354,10 @@ class AllBothPressManager:
             
             # Send MIDI CC ON
             try:
-                self.midi.send(Message('control_change', channel=0, control=self.cc_number, value=127))
-                print(f"All Both-Press Toggle ACTIVATED (CC {self.cc_number})")
+                self.midi.send(self._on_msg)
+                logger.info(lazy_format("All Both-Press Toggle ACTIVATED (CC {})", self.cc_number))
             except Exception as e:
-                print(f"Failed to send All Both-Press Toggle MIDI: {e}")
+                logger.error(lazy_format("Failed to send All Both-Press Toggle MIDI: {}", e))
             
             return True
         
@@ -218,62 +374,175 @@ class AllBothPressManager:
                 
                 # Send MIDI CC OFF
                 try:
-                    self.midi.send(Message('control_change', channel=0, control=self.cc_number, value=0))
-                    print(f"All Both-Press Toggle DEACTIVATED (CC {self.cc_number}) after {toggle_duration:.1f}s")
+                    self.midi.send(self._off_msg)
+                    logger.info(lazy_format("All Both-Press Toggle DEACTIVATED (CC {}) after {:.1f}s",
+                                            self.cc_number, toggle_duration))
                 except Exception as e:
-                    print(f"Failed to send All Both-Press Toggle MIDI: {e}")
+                    logger.error(lazy_format("Failed to send All Both-Press Toggle MIDI: {}", e))
                 
                 return True
         
         return False
 
 class SliderUI:
+    SEND_POLL_INTERVAL = 0.05  # seconds between checks while coalesced value sends are pending
+    TOGGLE_POLL_INTERVAL = 0.5  # seconds between checks while only the all-both-press timers run
+    MIN_ALARM_DELAY = 0.01
+    INPUT_WINDOW = 0.016  # seconds to gather repeated move keys before applying them
+
     def __init__(self, sliders):
-        self.midi = MidiInterface('MadMapper In')
-        self.slider_states = [SliderState(cfg) for cfg in sliders]
-        self.widgets = [SliderWidget(state, self.midi) for state in self.slider_states]
-        self.all_both_press_manager = AllBothPressManager(self.midi)
+        self.midi = MidiInterface(MIDI_PORT_NAME, ACTIVITY_PORT_NAME)
+        self.slider_states = [SliderState(cfg, i) for i, cfg in enumerate(sliders)]
+        # Min-heap of (deadline, seq, widget) for activity channels waiting to time out
+        self._pending_off = []
+        self._seq = itertools.count()
+        self.all_both_press_manager = AllBothPressManager(self.midi, self.slider_states)
+        self.widgets = [SliderWidget(state, self.midi, self._schedule_off, self.all_both_press_manager)
+                        for state in self.slider_states]
         self.listbox = urwid.ListBox(urwid.SimpleFocusListWalker(self.widgets))
         self.focus_index = 0
         self.widgets[self.focus_index].set_focus(True)
         self._main_loop = None
+        self._alarm = None
+        # Move keys buffered for the focused slider, applied by _flush_input()
+        self._pending_up = 0
+        self._pending_down = 0
+        self._input_alarm = None
+
+    def _schedule_off(self, deadline, widget):
+        heapq.heappush(self._pending_off, (deadline, next(self._seq), widget))
 
     def unhandled_input(self, key):
+        if key in ("right", "+"):
+            self._queue_move(up=True)
+            return
+        elif key in ("left", "-"):
+            self._queue_move(up=False)
+            return
+        
+        # Apply buffered moves first so keys take effect in the order pressed
+        now = time.monotonic()
+        self._flush_input(now)
         w = self.widgets[self.focus_index]
         if key in ("up", "k"):
             self._move_focus(-1)
         elif key in ("down", "j"):
             self._move_focus(1)
-        elif key in ("right", "+"):
-            w.move_up()
-        elif key in ("left", "-"):
-            w.move_down()
         elif key == " ":
-            w.both_press()
+            w.both_press(now)
         elif key == "b":
-            w.both_release()
+            w.both_release(now)
         elif key in ("q", "Q"):
             raise urwid.ExitMainLoop()
         else:
             w.reset_holds()
+        
+        self._after_input(now)
+
+    def _after_input(self, now):
+        # Input may have queued a send or changed the both-press set, so
+        # bring the toggle state up to date and re-arm the alarm
+        self.all_both_press_manager.update(now)
+        if self._main_loop is not None:
+            self._schedule_check(self._main_loop, now, any(s.dirty for s in self.slider_states))
+
+    def _queue_move(self, up):
+        """Buffer a move key; autorepeat bursts within INPUT_WINDOW are applied together."""
+        if up:
+            self._pending_up += 1
+        else:
+            self._pending_down += 1
+        
+        if self._main_loop is None:
+            self._flush_input(time.monotonic())
+        elif self._input_alarm is None:
+            self._input_alarm = self._main_loop.set_alarm_in(self.INPUT_WINDOW, self._on_input_alarm)
+
+    def _on_input_alarm(self, loop, user_data):
+        self._input_alarm = None
+        self._flush_input(time.monotonic())
+
+    def _flush_input(self, now):
+        """Apply buffered move keys to the focused slider in one update."""
+        if self._input_alarm is not None:
+            self._main_loop.remove_alarm(self._input_alarm)
+            self._input_alarm = None
+        if not (self._pending_up or self._pending_down):
+            return
+        
+        w = self.widgets[self.focus_index]
+        if self._pending_up:
+            w.move_up(self._pending_up, now)
+        if self._pending_down:
+            w.move_down(self._pending_down, now)
+        self._pending_up = 0
+        self._pending_down = 0
+        self._after_input(now)
 
     def _move_focus(self, delta):
+        # Both row updates land in the single redraw urwid does when the main
+        # loop goes idle after this input, and set_focus only invalidates a row
+        # whose rendered state actually changed
+        new_index = (self.focus_index + delta) % len(self.widgets)
+        if new_index == self.focus_index:
+            return
         self.widgets[self.focus_index].set_focus(False)
-        self.focus_index = (self.focus_index + delta) % len(self.widgets)
-        self.widgets[self.focus_index].set_focus(True)
+        self.focus_index = new_index
+        self.widgets[new_index].set_focus(True)
 
     def main(self):
         self._main_loop = urwid.MainLoop(self.listbox, unhandled_input=self.unhandled_input)
-        self._main_loop.set_alarm_in(0.1, self._periodic_activity_check)
+        self._schedule_check(self._main_loop, time.monotonic(), False)
         self._main_loop.run()
 
+    def _poll_interval(self, sends_pending):
+        """Return how often to poll for pending work, or None when there is none."""
+        if sends_pending:
+            return self.SEND_POLL_INTERVAL
+        manager = self.all_both_press_manager
+        if manager.all_both_pressed or manager.toggle_active:
+            # Toggle timers run in seconds, so a slow poll is enough
+            return self.TOGGLE_POLL_INTERVAL
+        return None
+
+    def _schedule_check(self, loop, now, sends_pending):
+        """Arm the alarm for the next activity deadline, polling only while work is pending."""
+        delay = None
+        if self._pending_off:
+            delay = max(self.MIN_ALARM_DELAY, self._pending_off[0][0] - now)
+        interval = self._poll_interval(sends_pending)
+        if interval is not None:
+            delay = interval if delay is None else min(delay, interval)
+        
+        if self._alarm is not None:
+            loop.remove_alarm(self._alarm)
+            self._alarm = None
+        if delay is not None:
+            self._alarm = loop.set_alarm_in(delay, self._periodic_activity_check)
+
     def _periodic_activity_check(self, loop, user_data):
+        self._alarm = None
         current_time = time.monotonic()
+        # Flushing clears every slider's pending value, so this pass also
+        # tells _schedule_check that no sends are waiting
         for w in self.widgets:
-            w.activity_check()
+            w.flush_pending(current_time)
+        
+        # Only widgets whose deadline passed are checked; ones pinged since
+        # they were scheduled are pushed back with their new deadline
+        heap = self._pending_off
+        rescheduled = []
+        while heap and heap[0][0] <= current_time:
+            _, _, w = heapq.heappop(heap)
+            deadline = w.activity_check(current_time)
+            if deadline is not None:
+                rescheduled.append((deadline, w))
+        for deadline, w in rescheduled:
+            self._schedule_off(deadline, w)
+        
         # Update all both-press manager
-        self.all_both_press_manager.update(self.slider_states, current_time)
-        loop.set_alarm_in(0.1, self._periodic_activity_check)
+        self.all_both_press_manager.update(current_time)
+        self._schedule_check(loop, current_time, False)
 
 def main():
     ui = SliderUI(SLIDERS)
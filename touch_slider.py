@@ -1,160 +1,293 @@
 import time
+from array import array
 from adafruit_midi.control_change import ControlChange
-from adafruit_debouncer import Debouncer
 from config import DEBOUNCE_INTERVAL, SLIDERS, ENABLE_TOUCH_LOGGING, ACTIVITY_TIMEOUT, BOTH_PRESSED_TIMEOUT
 from logger import get_logger, lazy_format
 
 # Get logger instance
 logger = get_logger()
 
+# -----------------------------------------------------------------------------
+# Structure-of-Arrays Slider State
+# -----------------------------------------------------------------------------
+class SliderState:
+    """Per-slider flags packed into parallel arrays, refreshed once per tick."""
+    
+    def __init__(self, count=0):
+        self.reset(count)
+    
+    def reset(self, count):
+        """Resize the arrays for a new set of (initially enabled) sliders."""
+        self.count = count
+        self.values = array("B", bytes(count))  # MIDI value (0-127) per slider
+        self.both_pressed = bytearray(count)  # 1 if enabled and both-pressed
+        self.enabled_pattern = b"\x01" * count  # 1 if enabled, rebuilt only on change
+        self.enabled_count = count
+    
+    def bind(self, touch_sliders):
+        """Size the arrays for the given sliders and assign each its index."""
+        self.reset(len(touch_sliders))
+        for i, slider in enumerate(touch_sliders):
+            slider.index = i
+            self.values[i] = int(slider.value)
+    
+    def set_enabled(self, index, enabled):
+        """Update one slider's enabled flag and rebuild the cached pattern."""
+        pattern = bytearray(self.enabled_pattern)
+        pattern[index] = 1 if enabled else 0
+        self.enabled_pattern = bytes(pattern)
+        self.enabled_count = sum(pattern)
+
+# Global slider state
+slider_state = SliderState()
+
+# MPR121 address -> sliders on that board, rebuilt by create_touch_sliders
+board_to_sliders = {}
+
+# Slider values are Q8 fixed point (value << 8) so fractional steps survive
+# without float arithmetic in the update loop
+Q8_SHIFT = 8
+Q8_MAX = 127 << Q8_SHIFT
+
+# Hold counts covered by the step table; past the last entry the slider has
+# long since hit the end of its range
+STEP_TABLE_SIZE = 128
+
+def to_q8(x):
+    """Convert a (possibly fractional) config value to Q8 fixed point."""
+    return int(round(x * (1 << Q8_SHIFT)))
+
+def build_step_table(config):
+    """Build the Q8 step for each hold count (index 0 unused, 1 is the first touch).
+    
+    Steps are clamped to the full range, which also keeps them within array("H").
+    """
+    speed = config["speed"]
+    accel_rate = config["accel_rate"]
+    table = array("H", [min(Q8_MAX, to_q8(speed + accel_rate * i)) for i in range(STEP_TABLE_SIZE)])
+    table[0] = table[1] = min(Q8_MAX, to_q8(config["speed_initial"]))
+    return table
+
+def get_slider_state():
+    """Get the global slider state arrays."""
+    return slider_state
+
+# -----------------------------------------------------------------------------
+# Touch Mask Debouncer
+# -----------------------------------------------------------------------------
+class BitDebouncer:
+    """Debounce one pin of a board's touch mask.
+    
+    Same state machine as adafruit_debouncer.Debouncer, but the caller passes
+    the tick's timestamp and touch mask in, so there is no predicate to call.
+    """
+    __slots__ = ("interval", "value", "_shift", "_unstable", "_last_bounce")
+    
+    def __init__(self, pin, interval):
+        self.interval = interval
+        self.value = 0  # Debounced state of the pin (0 or 1)
+        self._shift = pin
+        self._unstable = 0
+        self._last_bounce = 0.0
+    
+    def update(self, now, mask):
+        """Feed the current touch mask; now is the tick's monotonic timestamp."""
+        bit = (mask >> self._shift) & 1
+        if bit != self._unstable:
+            self._last_bounce = now
+            self._unstable = bit
+        elif bit != self.value and now - self._last_bounce >= self.interval:
+            self._last_bounce = now
+            self.value = bit
+
 # -----------------------------------------------------------------------------
 # Optimized TouchSlider Class with Cached Touch Data
 # -----------------------------------------------------------------------------
 class TouchSlider:
-    def __init__(self, mpr121, config, midi_interface):
-        self.mpr121 = mpr121
+    __slots__ = (
+        "config", "index", "_value_q8", "last_sent_value",
+        "both_pressed", "hold_count_down", "hold_count_up", "enabled", "display_dirty",
+        "cc_number", "both_press_cc", "activity_cc", "step_table",
+        "down_pin", "up_pin", "cached_touch_mask", "down_debouncer", "up_debouncer",
+        "activity_on", "last_activity_time", "_cc_msg", "_both_on_msg", "_both_off_msg",
+        "_activity_on_msg", "_activity_off_msg",
+    )
+    
+    def __init__(self, config):
         self.config = config
-        self.midi = midi_interface
-        self.value = float(config["initial_value"])
+        self.index = None  # Position in the shared SliderState, assigned on bind
+        self._value_q8 = int(config["initial_value"]) << Q8_SHIFT
         self.last_sent_value = config["initial_value"]
         self.both_pressed = False
         self.hold_count_down = 0
         self.hold_count_up = 0
         self.enabled = True  # Track if slider is functional
+        self.display_dirty = False  # Set when state changes outside update() (e.g. MIDI in)
+        
+        # Config values read every update, hoisted out of the config dict
+        self.cc_number = config["cc_number"]
+        self.both_press_cc = config["both_press_cc"]
+        self.activity_cc = config.get("activity_channel_cc")
+        self.step_table = build_step_table(config)
+        self.down_pin = config["down_pin"]
+        self.up_pin = config["up_pin"]
+        
+        # MIDI messages are built once and reused. The value message is mutated
+        # before each send; it is queued at most once per update, and the queue
+        # is flushed every tick, so a queued value can't be overwritten.
+        self._cc_msg = ControlChange(self.cc_number, 0)
+        if self.both_press_cc is not None:
+            self._both_on_msg = ControlChange(self.both_press_cc, 127)
+            self._both_off_msg = ControlChange(self.both_press_cc, 0)
+        else:
+            self._both_on_msg = self._both_off_msg = None
+        if self.activity_cc is not None:
+            self._activity_on_msg = ControlChange(self.activity_cc, 127)
+            self._activity_off_msg = ControlChange(self.activity_cc, 0)
+        else:
+            self._activity_on_msg = self._activity_off_msg = None
         
-        # Cache the touched_pins data to avoid repeated I2C calls
-        self.cached_touched_pins = [False] * 12
+        # Cache the board's touch bitmask (bit n = pin n) to avoid repeated I2C calls
+        self.cached_touch_mask = 0
         
-        # Create debouncers that use cached data instead of direct I2C access
-        self.down_debouncer = Debouncer(
-            lambda: self.cached_touched_pins[config["down_pin"]], 
-            interval=DEBOUNCE_INTERVAL
-        )
-        self.up_debouncer = Debouncer(
-            lambda: self.cached_touched_pins[config["up_pin"]], 
-            interval=DEBOUNCE_INTERVAL
-        )
+        # Debouncers are fed the cached mask instead of doing direct I2C access
+        self.down_debouncer = BitDebouncer(self.down_pin, DEBOUNCE_INTERVAL)
+        self.up_debouncer = BitDebouncer(self.up_pin, DEBOUNCE_INTERVAL)
         # Track activity channel state
         self.activity_on = False
         self.last_activity_time = time.monotonic()
 
-    def activity_ping(self):
-        self.last_activity_time = time.monotonic()
-        activity_cc = self.config.get("activity_channel_cc")
-        if activity_cc is not None and not self.activity_on:
-            self.midi.send(ControlChange(activity_cc, 127))
+    @property
+    def value(self):
+        """Current MIDI value (0-127) of the Q8 accumulator."""
+        return self._value_q8 >> Q8_SHIFT
+    
+    @value.setter
+    def value(self, value):
+        self._value_q8 = int(value) << Q8_SHIFT
+        # Write through to the shared values array read by the display
+        slider_state.values[self.index] = int(value)
+    
+    def activity_ping(self, pending_messages, now):
+        self.last_activity_time = now
+        if self.activity_cc is not None and not self.activity_on:
+            pending_messages.append(self._activity_on_msg)
             self.activity_on = True
 
-    def activity_check(self):
-        activity_cc = self.config.get("activity_channel_cc")
+    def activity_check(self, pending_messages, now):
         timeout = BOTH_PRESSED_TIMEOUT if self.both_pressed else ACTIVITY_TIMEOUT
-        if activity_cc is not None and self.activity_on:
-            if (time.monotonic() - self.last_activity_time) > timeout:
-                self.midi.send(ControlChange(activity_cc, 0))
+        if self.activity_cc is not None and self.activity_on:
+            if (now - self.last_activity_time) > timeout:
+                pending_messages.append(self._activity_off_msg)
                 self.activity_on = False
 
-    def update_touch_cache(self):
-        """Update the cached touch data from the MPR121."""
-        if not self.enabled:
-            return
-            
-        try:
-            # Single I2C read to get all touch states
-            self.cached_touched_pins = self.mpr121.touched_pins
-        except Exception as e:
-            logger.error(lazy_format("Error updating touch cache for slider {}: {}", 
-                                   self.config["cc_number"], e))
-            # Mark slider as disabled if we can't communicate with MPR121
-            self.enabled = False
-    
-    def update(self):
-        """Update slider state and return True if changes occurred."""
+    def update(self, pending_messages, now):
+        """Update slider state and return True if changes occurred.
+        
+        MIDI messages are appended to pending_messages for the caller to send;
+        now is the tick's monotonic timestamp.
+        """
         if not self.enabled:
             return False
             
         changed = False
-        activity_changed = False
-        try:
-            # Update debouncers using cached data
-            self.down_debouncer.update()
-            self.up_debouncer.update()
+        # Update debouncers using cached data
+        mask = self.cached_touch_mask
+        down_debouncer = self.down_debouncer
+        up_debouncer = self.up_debouncer
+        down_debouncer.update(now, mask)
+        up_debouncer.update(now, mask)
+        down = down_debouncer.value
+        up = up_debouncer.value
+        
+        # Idle fast path: nothing touched and nothing held, so no branch below can fire
+        if not (down or up or self.both_pressed or self.hold_count_down or self.hold_count_up):
+            return False
+        
+        # Check for both pins pressed
+        if down and up:
+            if not self.both_pressed and self.both_press_cc is not None:
+                pending_messages.append(self._both_on_msg)
+                if ENABLE_TOUCH_LOGGING and logger.debug_enabled:
+                    logger.debug(f"Touch -> Button (CC {self.both_press_cc}) ON")
+                self.both_pressed = True
+                changed = True
+                self.activity_ping(pending_messages, now)
+        else:
+            if self.both_pressed and self.both_press_cc is not None:
+                pending_messages.append(self._both_off_msg)
+                if ENABLE_TOUCH_LOGGING and logger.debug_enabled:
+                    logger.debug(f"Touch -> Button (CC {self.both_press_cc}) OFF")
+                self.both_pressed = False
+                changed = True
+                self.activity_ping(pending_messages, now)
             
-            # Check for both pins pressed
-            if self.down_debouncer.value and self.up_debouncer.value:
-                if not self.both_pressed and self.config["both_press_cc"] is not None:
-                    self.midi.send(ControlChange(self.config["both_press_cc"], 127))
-                    if ENABLE_TOUCH_LOGGING:
-                        logger.debug(lazy_format("Touch -> Button (CC {}) ON", self.config["both_press_cc"]))
-                    self.both_pressed = True
-                    changed = True
-                    self.activity_ping()
-            else:
-                if self.both_pressed and self.config["both_press_cc"] is not None:
-                    self.midi.send(ControlChange(self.config["both_press_cc"], 0))
-                    if ENABLE_TOUCH_LOGGING:
-                        logger.debug(lazy_format("Touch -> Button (CC {}) OFF", self.config["both_press_cc"]))
-                    self.both_pressed = False
-                    changed = True
-                    self.activity_ping()
-                
-                # Update value based on individual touches
-                if self.down_debouncer.value:
-                    self.hold_count_down += 1
-                    step = (self.config["speed_initial"] if self.hold_count_down == 1 
-                           else self.config["speed"] + (self.config["accel_rate"] * self.hold_count_down))
-                    self.value = max(0, self.value - step)
-                    changed = True
-                    self.activity_ping()
-                else:
-                    self.hold_count_down = 0
-                
-                if self.up_debouncer.value:
-                    self.hold_count_up += 1
-                    step = (self.config["speed_initial"] if self.hold_count_up == 1 
-                           else self.config["speed"] + (self.config["accel_rate"] * self.hold_count_up))
-                    self.value = min(127, self.value + step)
-                    changed = True
-                    self.activity_ping()
-                else:
-                    self.hold_count_up = 0
-                
-                # Send MIDI if value changed
-                if changed:
-                    new_value = int(self.value)
-                    if new_value != self.last_sent_value:
-                        self.midi.send(ControlChange(self.config["cc_number"], new_value))
-                        if ENABLE_TOUCH_LOGGING:
-                            logger.debug(lazy_format("Touch -> Slider (CC {}) = {}", self.config["cc_number"], new_value))
-                        self.last_sent_value = new_value
-                        self.activity_ping()
-            # Activity channel logic is now handled by activity_ping and activity_check
-        except Exception as e:
-            logger.error(lazy_format("Error updating slider {}: {}", self.config["cc_number"], e))
-            # Mark slider as disabled if we encounter persistent errors
-            self.enabled = False
+            # Update value based on individual touches
+            if down:
+                self.hold_count_down += 1
+                step = self.step_table[min(self.hold_count_down, STEP_TABLE_SIZE - 1)]
+                value_q8 = self._value_q8 - step
+                if value_q8 < 0:
+                    value_q8 = 0
+                self._value_q8 = value_q8
+                slider_state.values[self.index] = value_q8 >> Q8_SHIFT
+                changed = True
+                self.activity_ping(pending_messages, now)
+            elif self.hold_count_down:
+                # Pin released: the display still shows its status letter
+                self.hold_count_down = 0
+                self.display_dirty = True
+            
+            if up:
+                self.hold_count_up += 1
+                step = self.step_table[min(self.hold_count_up, STEP_TABLE_SIZE - 1)]
+                value_q8 = self._value_q8 + step
+                if value_q8 > Q8_MAX:
+                    value_q8 = Q8_MAX
+                self._value_q8 = value_q8
+                slider_state.values[self.index] = value_q8 >> Q8_SHIFT
+                changed = True
+                self.activity_ping(pending_messages, now)
+            elif self.hold_count_up:
+                # Pin released: the display still shows its status letter
+                self.hold_count_up = 0
+                self.display_dirty = True
+            
+            # Send MIDI if value changed
+            if changed:
+                new_value = self._value_q8 >> Q8_SHIFT
+                if new_value != self.last_sent_value:
+                    cc_msg = self._cc_msg
+                    cc_msg.value = new_value
+                    pending_messages.append(cc_msg)
+                    if ENABLE_TOUCH_LOGGING and logger.debug_enabled:
+                        logger.debug(f"Touch -> Slider (CC {self.cc_number}) = {new_value}")
+                    self.last_sent_value = new_value
+                    self.activity_ping(pending_messages, now)
         
-        return changed or activity_changed
+        return changed
     
     def get_status(self):
         """Get status information about this slider."""
         return {
             "cc_number": self.config["cc_number"],
-            "both_press_cc": self.config["both_press_cc"],
+            "both_press_cc": self.both_press_cc,
             "mpr121_address": hex(self.config["mpr121_address"]),
             "down_pin": self.config["down_pin"],
             "up_pin": self.config["up_pin"],
             "enabled": self.enabled,
-            "value": int(self.value),
+            "value": self.value,
             "both_pressed": self.both_pressed
         }
 
-def create_touch_sliders(mpr121_boards, midi_interface):
+def create_touch_sliders(mpr121_boards):
     """Create TouchSlider objects for all configured sliders with error handling."""
     touch_sliders = []
     created_count = 0
     skipped_count = 0
     
     logger.info("Creating touch sliders...")
+    board_to_sliders.clear()
     
     for config in SLIDERS:
         mpr121_addr = config["mpr121_address"]
@@ -168,12 +301,9 @@ def create_touch_sliders(mpr121_boards, midi_interface):
         
         try:
             # Create the slider
-            slider = TouchSlider(
-                mpr121_boards[mpr121_addr], 
-                config, 
-                midi_interface
-            )
+            slider = TouchSlider(config)
             touch_sliders.append(slider)
+            board_to_sliders.setdefault(mpr121_addr, []).append(slider)
             created_count += 1
             
             logger.debug(lazy_format("Created slider CC {} using MPR121 0x{:02X}", 
@@ -183,6 +313,8 @@ def create_touch_sliders(mpr121_boards, midi_interface):
             logger.error(lazy_format("Failed to create slider CC {}: {}", config["cc_number"], e))
             skipped_count += 1
     
+    slider_state.bind(touch_sliders)
+    
     logger.info(lazy_format("Touch slider creation complete: {} created, {} skipped", 
                            created_count, skipped_count))
     
@@ -197,22 +329,66 @@ def create_touch_sliders(mpr121_boards, midi_interface):
 def update_touch_cache_for_all_boards(mpr121_boards, touch_sliders):
     """Update touch cache for all MPR121 boards (single I2C read per board)."""
     for addr, mpr in mpr121_boards.items():
-        # Update cache for all sliders on this board
-        for slider in touch_sliders:
-            if slider.mpr121 == mpr:
-                slider.update_touch_cache()
-                break  # Only need to update once per board
-
-def update_all_sliders(touch_sliders):
-    """Update all sliders and return if any changed."""
+        sliders = board_to_sliders.get(addr)
+        if not sliders:
+            continue
+        
+        try:
+            # Single I2C read to get all touch states as a 12-bit mask
+            mask = mpr.touched()
+        except Exception as e:
+            logger.error(lazy_format("Error updating touch cache for MPR121 0x{:02X}: {}", addr, e))
+            # Can't communicate with the board, so disable all of its sliders
+            for slider in sliders:
+                slider.enabled = False
+            sliders.clear()
+            continue
+        
+        # Every slider on the board gets the same touch mask
+        for slider in sliders:
+            slider.cached_touch_mask = mask
+
+def _display_entry(index, slider):
+    """Build the (index, both_pressed, value, status) tuple the display renders."""
+    if slider.both_pressed:
+        status = 'B'
+    elif slider.down_debouncer.value:
+        status = 'D'
+    elif slider.up_debouncer.value:
+        status = 'U'
+    else:
+        status = ''
+    return (index, slider.both_pressed, slider_state.values[index], status)
+
+def collect_display_state(touch_sliders, out_changes):
+    """Append the display state of every slider to out_changes (for a full redraw)."""
+    for i, slider in enumerate(touch_sliders):
+        out_changes.append(_display_entry(i, slider))
+
+def update_all_sliders(touch_sliders, out_changes, pending_messages, now):
+    """Update all sliders, refresh the shared slider state and return if any changed.
+    
+    The display state of each slider that changed is appended to out_changes,
+    so the display only has to walk the changed sliders. MIDI messages are
+    appended to pending_messages so the tick's output goes out in one send.
+    """
     display_needs_update = False
-    active_sliders = 0
+    both_pressed = slider_state.both_pressed
     
-    for slider in touch_sliders:
+    for i, slider in enumerate(touch_sliders):
         if slider.enabled:
-            active_sliders += 1
-            if slider.update():
+            if slider.update(pending_messages, now) or slider.display_dirty:
+                slider.display_dirty = False
                 display_needs_update = True
+                out_changes.append(_display_entry(i, slider))
+        
+        # Record flags after the update, which may have disabled the slider.
+        # Both-press is masked by enabled on write so the "all pressed" check
+        # is a plain comparison against the enabled pattern.
+        enabled = slider.enabled
+        if enabled != slider_state.enabled_pattern[i]:
+            slider_state.set_enabled(i, enabled)
+        both_pressed[i] = 1 if enabled and slider.both_pressed else 0
     
     return display_needs_update
 
@@ -229,8 +405,8 @@ def get_slider_status(touch_sliders):
         "disabled_cc_numbers": [s.config["cc_number"] for s in disabled_sliders]
     } 
 
-def activity_check_all_sliders(touch_sliders):
-    """Call activity_check for all sliders."""
+def activity_check_all_sliders(touch_sliders, pending_messages, now):
+    """Call activity_check for all sliders, appending any MIDI to pending_messages."""
     for slider in touch_sliders:
         if slider.enabled:
-            slider.activity_check() 
\ No newline at end of file
+            slider.activity_check(pending_messages, now)
\ No newline at end of file